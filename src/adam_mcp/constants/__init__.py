@@ -11,13 +11,15 @@ from adam_mcp.constants.dimensions import (
 from adam_mcp.constants.messages import (
     ERROR_FILE_NOT_FOUND,
     ERROR_FREECAD_API,
+    ERROR_FREECAD_API_SUGGESTION,
     ERROR_INSTALL_INSTRUCTIONS,
     ERROR_INVALID_DIMENSION,
     ERROR_INVALID_OBJECT,
-    ERROR_NO_ACTIVE_DOC,
     ERROR_NO_OPEN_DOC,
+    ERROR_NOT_FREECAD_FILE,
     ERROR_PATH_NOT_FOUND,
     ERROR_PLATFORM_UNSUPPORTED,
+    ERROR_UNSAVED_OPERATIONS,
     ERROR_VALIDATION_FAILED,
     MSG_ENV_OVERRIDE,
     MSG_EXTENSIONS_PATH,
@@ -33,9 +35,14 @@ from adam_mcp.constants.messages import (
 )
 from adam_mcp.constants.operations import (
     AUTO_SAVE_INTERVAL,
+    AUTO_SAVE_MAX_DELAY_SECONDS,
+    AUTO_SAVE_MAX_INTERVAL,
+    AUTO_SAVE_SIZE_UNIT_MB,
+    COMMIT_TEMP_SUFFIX,
     DEFAULT_DOCUMENT_NAME,
     DEFAULT_SKETCH_NAME,
     MAX_DOCUMENT_NAME_LENGTH,
+    MAX_OPEN_DOCUMENTS,
     SERVER_NAME,
     SERVER_VERSION,
     VALIDATE_BEFORE_COMMIT,
@@ -74,12 +81,14 @@ __all__ = [
     "MIN_ANGLE_DEGREES",
     "MAX_ANGLE_DEGREES",
     # Messages
-    "ERROR_NO_ACTIVE_DOC",
     "ERROR_NO_OPEN_DOC",
     "ERROR_FREECAD_API",
+    "ERROR_FREECAD_API_SUGGESTION",
     "ERROR_INVALID_DIMENSION",
     "ERROR_INVALID_OBJECT",
     "ERROR_FILE_NOT_FOUND",
+    "ERROR_NOT_FREECAD_FILE",
+    "ERROR_UNSAVED_OPERATIONS",
     "ERROR_VALIDATION_FAILED",
     "ERROR_PATH_NOT_FOUND",
     "ERROR_PLATFORM_UNSUPPORTED",
@@ -101,8 +110,13 @@ __all__ = [
     "DEFAULT_DOCUMENT_NAME",
     "DEFAULT_SKETCH_NAME",
     "MAX_DOCUMENT_NAME_LENGTH",
+    "MAX_OPEN_DOCUMENTS",
     "AUTO_SAVE_INTERVAL",
+    "AUTO_SAVE_MAX_DELAY_SECONDS",
+    "AUTO_SAVE_MAX_INTERVAL",
+    "AUTO_SAVE_SIZE_UNIT_MB",
     "WORK_FILE_SUFFIX",
+    "COMMIT_TEMP_SUFFIX",
     "VALIDATE_BEFORE_COMMIT",
     "WORK_DIR_ENV_VAR",
     # Paths
@@ -22,3 +22,12 @@ MAX_ANGLE_DEGREES = 360.0
 
 MIN_POLYGON_SIDES = 3  # Triangle (minimum closed polygon)
 MAX_POLYGON_SIDES = 12  # Dodecagon (MVP limit for performance)
+
+# ============================================================================
+# Thread Constraints
+# ============================================================================
+
+# Standard ISO metric thread sizes
+SUPPORTED_THREAD_TYPES = frozenset(
+    {"M3", "M4", "M5", "M6", "M8", "M10", "M12", "M14", "M16", "M20", "M24", "M30"}
+)
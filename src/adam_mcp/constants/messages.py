@@ -5,12 +5,17 @@
 # ============================================================================
 
 # Document errors
-ERROR_NO_ACTIVE_DOC = "No active FreeCAD document. Open or create a document first."
 ERROR_NO_OPEN_DOC = "No document open. Use open_document() or create_document() first."
 ERROR_FREECAD_API = "FreeCAD API error: {error}. {suggestion}"
+ERROR_FREECAD_API_SUGGESTION = "Check FreeCAD documentation for valid parameters."
 ERROR_INVALID_DIMENSION = "Dimension {value} mm is outside valid range ({min_val}-{max_val} mm)"
 ERROR_INVALID_OBJECT = "Object '{name}' not found in active document"
 ERROR_FILE_NOT_FOUND = "File not found: {path}"
+ERROR_NOT_FREECAD_FILE = "Not a FreeCAD document (expected .FCStd archive): {path}"
+ERROR_UNSAVED_OPERATIONS = (
+    "Pending operations could not be saved to the working file: {path}. "
+    "The current document was kept active so its changes are not lost."
+)
 ERROR_VALIDATION_FAILED = (
     "Document validation failed. Cannot commit corrupted state. "
     "Fix errors or use rollback_working_changes() to discard changes."
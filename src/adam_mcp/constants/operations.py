@@ -14,12 +14,17 @@ SERVER_VERSION = "0.1.0"
 DEFAULT_DOCUMENT_NAME = "CAD_Design"
 DEFAULT_SKETCH_NAME = "Sketch"
 MAX_DOCUMENT_NAME_LENGTH = 100
+MAX_OPEN_DOCUMENTS = 3  # Documents kept loaded in FreeCAD for fast switching (LRU)
 
 # ============================================================================
 # Working File Configuration
 # ============================================================================
 
 AUTO_SAVE_INTERVAL = 1  # Save working file every N operations (immediate GUI sync)
+AUTO_SAVE_SIZE_UNIT_MB = 1.0  # Documents above this size auto-save less often (log2 scaling)
+AUTO_SAVE_MAX_INTERVAL = 50  # Upper bound on operations between auto-saves (large documents)
+AUTO_SAVE_MAX_DELAY_SECONDS = 30.0  # Next operation saves if the last save is older than this
 WORK_FILE_SUFFIX = "_work"  # Suffix for working files (inserted before .FCStd extension)
+COMMIT_TEMP_SUFFIX = ".tmp"  # Suffix for temporary file written next to main file during commit
 VALIDATE_BEFORE_COMMIT = True  # Safety gate for commits
 WORK_DIR_ENV_VAR = "ADAM_MCP_WORK_DIR"  # Environment variable for custom work directory
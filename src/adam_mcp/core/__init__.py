@@ -2,13 +2,21 @@
 
 from adam_mcp.core.freecad_env import setup_freecad_environment
 from adam_mcp.core.working_files import (
+    DocumentSession,
     auto_save_after,
     auto_save_working_file,
-    get_active_main_file_path,
-    get_active_work_file_path,
+    bump_document_revision,
+    commit_working_file,
+    flush_working_file,
+    get_session,
+    get_session_document,
     get_work_file_path,
     increment_operation_counter,
+    mark_working_file_saved,
+    require_active_files,
     reset_operation_counter,
+    reset_working_file,
+    set_active_document_name,
     set_active_files,
     setup_working_file,
 )
@@ -16,11 +24,19 @@ from adam_mcp.core.working_files import (
 __all__ = [
     "setup_freecad_environment",
     "auto_save_after",
-    "get_active_main_file_path",
-    "get_active_work_file_path",
+    "bump_document_revision",
+    "commit_working_file",
+    "DocumentSession",
+    "flush_working_file",
+    "get_session",
+    "get_session_document",
     "get_work_file_path",
     "increment_operation_counter",
+    "mark_working_file_saved",
     "reset_operation_counter",
+    "require_active_files",
+    "reset_working_file",
+    "set_active_document_name",
     "set_active_files",
     "setup_working_file",
     "auto_save_working_file",
@@ -140,17 +140,24 @@ def _append_to_env_var(var_name: str, new_value: str, separator: str) -> None:
 # Environment Setup
 # ============================================================================
 
+_environment_configured = False  # Set once setup has completed in this process
+
 
 def setup_freecad_environment() -> None:
     """
     Configure Python environment for FreeCAD integration
 
-    Call this before importing FreeCAD modules.
+    Call this before importing FreeCAD modules. Repeat calls in the same process
+    are no-ops (library paths would otherwise be prepended again).
 
     Raises:
         RuntimeError: If platform is unsupported
         FileNotFoundError: If FreeCAD installation not found
     """
+    global _environment_configured
+    if _environment_configured:
+        return
+
     # Detect platform and get paths
     paths = get_platform_paths()
     system = platform.system()
@@ -174,6 +181,8 @@ def setup_freecad_environment() -> None:
     elif system == "Windows":
         _append_to_env_var(ENV_VAR_WINDOWS_PATH, paths.lib, ";")
 
+    _environment_configured = True
+
     # Success message
     print(MSG_SUCCESS)
     print(MSG_PLATFORM.format(system))
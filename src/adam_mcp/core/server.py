@@ -11,7 +11,10 @@ Pattern:
     3. Define and run server
 """
 
+from typing import Annotated
+
 from fastmcp import FastMCP
+from pydantic import Field
 
 from adam_mcp.constants.operations import SERVER_NAME
 from adam_mcp.core.freecad_env import setup_freecad_environment
@@ -247,7 +250,9 @@ def list_objects_tool() -> ObjectListResponse:
 
 
 @mcp.tool()
-def get_object_details_tool(names: list[str]) -> ObjectDetailsResponse:
+def get_object_details_tool(
+    names: list[str], max_properties: Annotated[int | None, Field(ge=0)] = None
+) -> ObjectDetailsResponse:
     """
     Get detailed information for specific objects.
 
@@ -260,6 +265,8 @@ def get_object_details_tool(names: list[str]) -> ObjectDetailsResponse:
 
     Args:
         names: List of object names to fetch details for
+        max_properties: Optional limit on properties returned per object (property_count
+                        still reports the total). Omit to return all properties.
 
     Returns:
         Detailed information for found objects, plus list of not found names
@@ -267,7 +274,7 @@ def get_object_details_tool(names: list[str]) -> ObjectDetailsResponse:
     Raises:
         RuntimeError: If no active document exists
     """
-    return get_object_details(names)
+    return get_object_details(names, max_properties)
 
 
 @mcp.tool()
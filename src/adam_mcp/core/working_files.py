@@ -4,19 +4,32 @@ Working file infrastructure for adam-mcp
 Manages working files for safe editing with auto-save and commit/rollback.
 """
 
+import logging
+import math
 import os
-import shutil
+import sys
 import tempfile
+import threading
+import time
 from collections.abc import Callable
-from functools import wraps
+from dataclasses import dataclass
+from functools import cache, lru_cache, wraps
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
+from adam_mcp.constants.messages import ERROR_NO_OPEN_DOC, ERROR_UNSAVED_OPERATIONS
 from adam_mcp.constants.operations import (
     AUTO_SAVE_INTERVAL,
+    AUTO_SAVE_MAX_DELAY_SECONDS,
+    AUTO_SAVE_MAX_INTERVAL,
+    AUTO_SAVE_SIZE_UNIT_MB,
+    COMMIT_TEMP_SUFFIX,
     WORK_DIR_ENV_VAR,
     WORK_FILE_SUFFIX,
 )
+from adam_mcp.utils.freecad import backup_files_disabled, get_loaded_document
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
@@ -28,9 +41,22 @@ if TYPE_CHECKING:
 # Global State (Working File Management)
 # ============================================================================
 
-_active_main_file_path: str | None = None
-_active_work_file_path: str | None = None
-_operation_counter: int = 0
+
+@dataclass(slots=True)
+class DocumentSession:
+    """Active document session (working file paths and operation counters)"""
+
+    main_path: str | None = None
+    work_path: str | None = None
+    doc_name: str | None = None  # FreeCAD document loaded from the working file
+    revision: int = 0  # Monotonic, bumped whenever the document may change (never reset)
+    unsaved_ops: int = 0  # Operations since the working file was last saved
+    save_interval: int = AUTO_SAVE_INTERVAL  # Adapted to working file size after each save
+    last_save_time: float = 0.0  # time.monotonic() of the last working file save
+    work_matches_main: bool = False  # Working file unchanged since the last commit or reset
+
+
+_session = DocumentSession()
 
 
 # ============================================================================
@@ -38,27 +64,88 @@ _operation_counter: int = 0
 # ============================================================================
 
 
-def get_active_main_file_path() -> str | None:
-    """Get the current main file path"""
-    return _active_main_file_path
+def get_session() -> DocumentSession:
+    """Get the active document session"""
+    return _session
+
+
+def bump_document_revision() -> int:
+    """
+    Mark the document as (about to be) changed
+
+    Call before mutating the document. Results cached against an older
+    revision (e.g. validation) no longer apply.
+
+    Returns:
+        New document revision
+    """
+    _session.revision += 1
+    return _session.revision
 
 
-def get_active_work_file_path() -> str | None:
-    """Get the current working file path"""
-    return _active_work_file_path
+def require_active_files() -> tuple[str, str]:
+    """
+    Get the active main and working file paths
 
+    Returns:
+        Tuple of (main file path, working file path)
 
-def set_active_files(main_path: str, work_path: str) -> None:
-    """Set the active main and working file paths"""
-    global _active_main_file_path, _active_work_file_path
-    _active_main_file_path = main_path
-    _active_work_file_path = work_path
+    Raises:
+        RuntimeError: If no document has been opened or created
+    """
+    main_path, work_path = _session.main_path, _session.work_path
+    if main_path is None or work_path is None:
+        raise RuntimeError(ERROR_NO_OPEN_DOC)
+    return main_path, work_path
+
+
+def get_session_document() -> Any:
+    """
+    Get the FreeCAD document loaded from the session's working file
+
+    Looks the document up by the name recorded when it was opened, so tools act on
+    the session's document even if another document became active.
+
+    Returns:
+        Session document object
+
+    Raises:
+        RuntimeError: If no document has been opened or created, it is no longer
+            loaded, or FreeCAD is not initialized
+    """
+    doc_name = _session.doc_name
+    doc = get_loaded_document(doc_name) if doc_name is not None else None
+    if doc is None:
+        raise RuntimeError(ERROR_NO_OPEN_DOC)
+    return doc
+
+
+def set_active_files(main_path: str, work_path: str, doc_name: str | None = None) -> None:
+    """Set the active main and working file paths (and the FreeCAD document name)"""
+    _session.main_path = main_path
+    _session.work_path = work_path
+    _session.doc_name = doc_name
+    _session.work_matches_main = False  # Resumed working files may differ from main
+
+
+def set_active_document_name(doc_name: str) -> None:
+    """Set the name of the FreeCAD document loaded from the working file"""
+    _session.doc_name = doc_name
+
+
+def mark_working_file_saved() -> None:
+    """Record that the working file on disk matches the in-memory document"""
+    _session.unsaved_ops = 0
+    _session.last_save_time = time.monotonic()
+    _session.work_matches_main = False
 
 
 def reset_operation_counter() -> None:
-    """Reset the operation counter to zero"""
-    global _operation_counter
-    _operation_counter = 0
+    """Reset the unsaved operation counter to zero (a document was loaded or reloaded)"""
+    _session.revision += 1
+    _session.unsaved_ops = 0
+    # First operation on a newly loaded document saves, re-adapting save_interval
+    _session.last_save_time = 0.0
 
 
 # ============================================================================
@@ -109,6 +196,25 @@ def _is_valid_freecad_file(file_path: str) -> bool:
         return False
 
 
+# Read once - the work directory setting is fixed for the life of the process
+_WORK_DIR_SETTING = os.environ.get(WORK_DIR_ENV_VAR)
+
+# Custom work directory as a plain string, resolved once ("temp" selects the
+# system temp directory); None places working files next to the main file
+_WORK_DIR: str | None = (
+    (tempfile.gettempdir() + os.sep + "adam_mcp_work")
+    if _WORK_DIR_SETTING == "temp"
+    else _WORK_DIR_SETTING or None
+)
+
+
+@cache
+def _ensure_work_dir(work_dir: str) -> None:
+    """Create a custom work directory (once per directory per process)"""
+    Path(work_dir).mkdir(parents=True, exist_ok=True)
+
+
+@lru_cache(maxsize=64)
 def get_work_file_path(main_file_path: str) -> str:
     """
     Determine working file path from main file path
@@ -124,40 +230,36 @@ def get_work_file_path(main_file_path: str) -> str:
         - "/path/to/bolt.FCStd" → "/path/to/bolt_work.FCStd"
 
     Uses environment variable ADAM_MCP_WORK_DIR if set, otherwise
-    places working file in same directory as main file.
+    places working file in same directory as main file. The variable is read
+    once at import, and results are memoized per main file path.
     """
-    main_path = Path(main_file_path).resolve()
+    # Callers pass paths already resolved by resolve_project_path, so only make
+    # the path absolute (no syscalls) instead of resolving symlinks again
+    main_path = Path(main_file_path).absolute()
 
-    # Check for custom work directory
-    work_dir_str = os.environ.get(WORK_DIR_ENV_VAR)
-
-    if work_dir_str:
-        # Use ternary operator for temp directory selection
-        work_dir: Path = (
-            Path(tempfile.gettempdir()) / "adam_mcp_work"
-            if work_dir_str == "temp"
-            else Path(work_dir_str)
-        )
+    # Insert suffix before extension: "bracket.FCStd" → "bracket_work.FCStd"
+    work_file_name = main_path.stem + WORK_FILE_SUFFIX + main_path.suffix
 
+    if _WORK_DIR:
         # Create work directory if needed
-        work_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_work_dir(_WORK_DIR)
+        work_dir = _WORK_DIR
+    else:
+        # Default: same directory as main file
+        work_dir = str(main_path.parent)
 
-        # Insert suffix before extension: "bracket.FCStd" → "bracket_work.FCStd"
-        work_file_name = main_path.stem + WORK_FILE_SUFFIX + main_path.suffix
-        return str(work_dir / work_file_name)
-
-    # Default: same directory as main file
-    # Insert suffix before extension: "bracket.FCStd" → "bracket_work.FCStd"
-    work_file_name = main_path.stem + WORK_FILE_SUFFIX + main_path.suffix
-    return str(main_path.parent / work_file_name)
+    # Plain string join - no intermediate Path objects
+    return work_dir.rstrip(os.sep) + os.sep + work_file_name
 
 
-def setup_working_file(main_file_path: str) -> str:
+def setup_working_file(main_file_path: str, main_stat: os.stat_result | None = None) -> str:
     """
     Setup working file from main file
 
     Args:
         main_file_path: Path to main .FCStd file
+        main_stat: Optional stat result for main file (caller already checked it
+            exists, so the existence check is skipped)
 
     Returns:
         Path to working file
@@ -179,83 +281,306 @@ def setup_working_file(main_file_path: str) -> str:
         Path(work_file_path).unlink(missing_ok=True)
 
     # Initialize work file from main if main exists
-    if Path(main_file_path).exists():
-        shutil.copy2(main_file_path, work_file_path)
+    if main_stat is not None or Path(main_file_path).exists():
+        _fast_copy(main_file_path, work_file_path, main_stat)
 
     return work_file_path
 
 
+# ============================================================================
+# Fast File Copy
+# ============================================================================
+
+_COPY_CHUNK_SIZE = 1 << 20  # 1 MB buffer for the portable copy loop
+_copy_buffer = bytearray(_COPY_CHUNK_SIZE)  # Shared by all buffered copies (allocated once)
+_copy_buffer_lock = threading.Lock()  # Guards the shared buffer if tools run concurrently
+_FICLONE = 0x40049409  # Linux reflink ioctl (fcntl.FICLONE on Python 3.12+)
+
+
+def _copy_file_kernel(src: str, dst: str, size: int) -> bool:
+    """
+    Copy a file without passing data through user space (Linux)
+
+    Tries a reflink clone first (O(1) extent sharing on btrfs/XFS), then
+    os.copy_file_range (in-kernel copy).
+
+    Returns:
+        True if copied in full, False if neither mechanism is supported here or
+        the in-kernel copy stopped short
+    """
+    import fcntl
+
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            try:
+                fcntl.ioctl(dst_fd, getattr(fcntl, "FICLONE", _FICLONE), src_fd)
+                return True
+            except OSError:
+                pass  # Not a CoW filesystem (or cross-device) - try in-kernel copy
+
+            if not hasattr(os, "copy_file_range"):
+                return False
+            try:
+                copied = 0
+                while copied < size:
+                    count = os.copy_file_range(src_fd, dst_fd, size - copied)
+                    if count == 0:
+                        break
+                    copied += count
+            except OSError:
+                return False  # Unsupported (e.g. cross-device on old kernels)
+            # Stopped early (e.g. source changed size) - let the buffered copy redo it
+            return copied == size
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _copy_file_windows(src: str, dst: str) -> bool:
+    """
+    Copy a file with the native CopyFileW API (Windows)
+
+    Returns:
+        True if copied, False if the call failed
+    """
+    if sys.platform == "win32":
+        import ctypes
+
+        return bool(ctypes.windll.kernel32.CopyFileW(src, dst, False))
+    return False
+
+
+def _copy_file_buffered(src: str, dst: str) -> None:
+    """Copy a file through the shared 1 MB buffer (portable fallback)"""
+    with (
+        _copy_buffer_lock,
+        Path(src).open("rb", buffering=0) as fsrc,
+        Path(dst).open("wb") as fdst,
+    ):
+        view = memoryview(_copy_buffer)
+        while count := fsrc.readinto(_copy_buffer):
+            fdst.write(view[:count])
+
+
+def _fast_copy(src: str, dst: str, src_stat: os.stat_result | None = None) -> None:
+    """
+    Copy a file using the fastest mechanism the platform supports
+
+    Args:
+        src: Source file path
+        dst: Destination file path (overwritten)
+        src_stat: Optional stat result for src (saves a stat if caller has one)
+
+    Raises:
+        OSError: If the file can't be copied
+
+    Uses reflink / copy_file_range on Linux and CopyFileW on Windows, falling
+    back to a buffered copy. Preserves the source modification time (like
+    shutil.copy2) so file times still reflect when the content was written.
+    """
+    if src_stat is None:
+        src_stat = Path(src).stat()
+
+    if sys.platform == "win32":
+        copied = _copy_file_windows(src, dst)
+    elif sys.platform.startswith("linux"):
+        copied = _copy_file_kernel(src, dst, src_stat.st_size)
+    else:
+        copied = False
+
+    if not copied:
+        _copy_file_buffered(src, dst)
+
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
+def commit_working_file(work_file_path: str, main_file_path: str) -> bool:
+    """
+    Atomically replace main file with working file contents
+
+    Args:
+        work_file_path: Path to working file (source)
+        main_file_path: Path to main file (destination)
+
+    Returns:
+        True if main file was updated, False if the session's working file has not
+        been saved since its last commit or reset (main already matches it)
+
+    Raises:
+        OSError: If copy or replace fails (main file is left untouched)
+
+    Copies to a temporary file next to the main file, then renames it over
+    the main file (atomic os.replace). The temp file lives in the main file's
+    directory so the rename never crosses filesystems. An interrupted commit
+    therefore never leaves a partially written main file.
+    """
+    is_session_file = (work_file_path, main_file_path) == (_session.work_path, _session.main_path)
+    if is_session_file and _session.work_matches_main:
+        return False
+
+    temp_file_path = main_file_path + COMMIT_TEMP_SUFFIX
+    try:
+        _fast_copy(work_file_path, temp_file_path)
+        Path(temp_file_path).replace(main_file_path)
+    except OSError:
+        Path(temp_file_path).unlink(missing_ok=True)
+        raise
+
+    if is_session_file:
+        _session.work_matches_main = True
+    return True
+
+
+def reset_working_file(main_file_path: str, work_file_path: str) -> None:
+    """
+    Overwrite working file with main file contents (discards uncommitted changes)
+
+    Args:
+        main_file_path: Path to main file (source)
+        work_file_path: Path to working file (destination)
+
+    Raises:
+        OSError: If copy fails
+    """
+    _fast_copy(main_file_path, work_file_path)
+    if (work_file_path, main_file_path) == (_session.work_path, _session.main_path):
+        _session.work_matches_main = True
+
+
 # ============================================================================
 # Auto-save Infrastructure
 # ============================================================================
 
 
-def auto_save_working_file() -> None:
+def _auto_save_interval(file_size: int) -> int:
+    """
+    Compute auto-save interval for a working file of the given size
+
+    Args:
+        file_size: Working file size in bytes
+
+    Returns:
+        Operations between auto-saves (AUTO_SAVE_INTERVAL for small documents,
+        growing with log2 of the size so large documents are rewritten less often,
+        capped at AUTO_SAVE_MAX_INTERVAL)
+    """
+    size_units = file_size / (1024 * 1024) / AUTO_SAVE_SIZE_UNIT_MB
+    if size_units <= 1:
+        return AUTO_SAVE_INTERVAL
+    interval = int(AUTO_SAVE_INTERVAL * (1 + math.log2(size_units)))
+    return min(max(AUTO_SAVE_INTERVAL, interval), AUTO_SAVE_MAX_INTERVAL)
+
+
+def _prefetch_saved_file(file_path: str) -> int:
+    """
+    Hint the OS to keep a just-saved file in page cache
+
+    Args:
+        file_path: Path to saved file
+
+    Returns:
+        File size in bytes
+
+    The next commit copies this file, so keeping it cached avoids re-reading
+    it from disk. The hint is skipped on platforms without posix_fadvise.
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        return os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+
+
+def auto_save_working_file() -> bool:
     """
     Auto-save working file (called after operations)
 
-    Saves the active document to the working file path.
+    Saves the session document to the working file path. The session document is
+    used rather than FreeCAD's active document, so another document never gets
+    written over this session's working file.
 
-    Silent fail if no active document or no working file configured.
+    Silent fail if no session document or no working file configured.
+
+    Returns:
+        True if the working file was saved, False if the save was skipped or failed
 
     Note: Temporarily disables FreeCAD backup file creation during auto-save
     to prevent accumulation of timestamped .FCBak files.
     """
-    global _active_work_file_path
-
     try:
-        import FreeCAD
-    except ImportError:
-        print("Warning: Auto-save skipped - FreeCAD not available")
-        return
-
-    doc = FreeCAD.ActiveDocument
-    if doc and _active_work_file_path:
-        try:
-            # Recompute document to ensure all changes are processed
-            doc.recompute()
+        _, work_path = require_active_files()
+        doc = get_session_document()
+    except RuntimeError as e:
+        logger.warning("Auto-save skipped - %s", e)
+        return False
 
-            # Temporarily disable backup file creation for auto-save
-            # to prevent accumulation of timestamped .FCBak files
-            param_group = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Document")
-            original_backup_setting = param_group.GetBool("CreateBackupFiles", True)
+    try:
+        # Recompute document to ensure all changes are processed
+        doc.recompute()
+
+        # Temporarily disable backup file creation for auto-save
+        # to prevent accumulation of timestamped .FCBak files
+        with backup_files_disabled():
+            # Use saveAs to ensure we're saving to the correct path
+            # (doc.save() might not work if FileName isn't properly set)
+            doc.saveAs(work_path)
+            logger.debug("Auto-save successful: %s", work_path)
+
+        mark_working_file_saved()
+        _session.save_interval = _auto_save_interval(_prefetch_saved_file(work_path))
+        return True
 
-            try:
-                # Disable backups during auto-save
-                param_group.SetBool("CreateBackupFiles", False)
-
-                # Use saveAs to ensure we're saving to the correct path
-                # (doc.save() might not work if FileName isn't properly set)
-                doc.saveAs(_active_work_file_path)
-                print(f"Auto-save successful: {_active_work_file_path}")
-            finally:
-                # Restore original backup setting
-                param_group.SetBool("CreateBackupFiles", original_backup_setting)
-
-        except (RuntimeError, OSError) as e:
-            # Log but don't crash - auto-save is best-effort
-            print(f"Warning: Auto-save failed: {e}")
-    else:
-        print(
-            f"Warning: Auto-save skipped - doc={doc is not None}, work_path={_active_work_file_path}"
-        )
+    except (RuntimeError, OSError) as e:
+        # Log but don't crash - auto-save is best-effort
+        logger.warning("Auto-save failed: %s", e)
+        return False
 
 
 def increment_operation_counter() -> None:
     """
     Track operations and trigger auto-save
 
-    Increments operation counter and triggers auto-save
-    every AUTO_SAVE_INTERVAL operations.
+    Increments the unsaved operation counter and triggers
+    auto-save once save_interval operations are unsaved (AUTO_SAVE_INTERVAL,
+    scaled up for large documents), or early if the last save was more than
+    AUTO_SAVE_MAX_DELAY_SECONDS ago. The time check runs only when an operation
+    arrives (there is no timer), so it never defers a save - operations still
+    pending are written by flush_working_file() or commit_changes().
     """
-    global _operation_counter
+    session = _session
+    session.unsaved_ops += 1
 
-    _operation_counter += 1
-
-    if _operation_counter % AUTO_SAVE_INTERVAL == 0:
+    if (
+        session.unsaved_ops >= session.save_interval
+        or time.monotonic() - session.last_save_time >= AUTO_SAVE_MAX_DELAY_SECONDS
+    ):
         auto_save_working_file()
 
 
+def flush_working_file() -> None:
+    """
+    Save the working file if operations are pending since the last auto-save
+
+    Call before the working file is read externally or the session switches to
+    another document.
+
+    Raises:
+        RuntimeError: If the session document is still loaded but its pending
+            operations could not be saved (switching away would lose them)
+    """
+    if not _session.unsaved_ops or auto_save_working_file():
+        return
+    # Only a still-loaded document holds edits that switching away would lose
+    doc_name = _session.doc_name
+    if doc_name is not None and get_loaded_document(doc_name) is not None:
+        raise RuntimeError(ERROR_UNSAVED_OPERATIONS.format(path=_session.work_path))
+
+
 def auto_save_after(func: Callable[..., T]) -> Callable[..., T]:
     """
     Decorator: auto-save working file after tool execution
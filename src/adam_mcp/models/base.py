@@ -1,9 +1,12 @@
 """Base models for adam-mcp operations"""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BaseOperation(BaseModel):
     """Base class for all CAD operations"""
 
+    # Operations are immutable once built - handlers only read their fields
+    model_config = ConfigDict(frozen=True)
+
     description: str = Field(description="Human-readable description of operation")
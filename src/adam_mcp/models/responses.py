@@ -82,6 +82,9 @@ class ObjectDetail(BaseModel):
     type: str = Field(description="FreeCAD object type")
     label: str = Field(description="Human-readable label")
     properties: list[ObjectProperty] = Field(description="Object properties and values")
+    property_count: int = Field(
+        description="Total number of properties (can exceed len(properties) when limited)"
+    )
     depends_on: list[str] = Field(
         default_factory=list, description="Names of objects this depends on"
     )
@@ -4,7 +4,11 @@
 from collections.abc import Callable
 from typing import Any
 
-from adam_mcp.core.working_files import auto_save_after
+from adam_mcp.core.working_files import (
+    auto_save_after,
+    bump_document_revision,
+    get_session_document,
+)
 from adam_mcp.models.operations.features import CreatePad, CreatePocket, CreateThread
 from adam_mcp.models.operations.modifications import ModifyObject
 from adam_mcp.models.operations.primitives import CreateCylinder
@@ -27,7 +31,6 @@ from adam_mcp.operations.handlers.sketches import (
     execute_create_sketch,
 )
 from adam_mcp.utils.errors import format_freecad_error
-from adam_mcp.utils.freecad import get_active_document
 from adam_mcp.utils.validation import validate_document
 
 # Union type of all supported operations (MVP Iteration 3: primitives + sketches + features + modifications)
@@ -75,8 +78,8 @@ def execute_operation(operation: Operation) -> OperationResult:
         No exceptions - all errors caught and returned in OperationResult
     """
     try:
-        # Get active document
-        doc = get_active_document()
+        # Get the session document (not whichever document FreeCAD has active)
+        doc = get_session_document()
 
         # Get handler for this operation type
         handler = OPERATION_HANDLERS.get(operation.action)
@@ -87,11 +90,13 @@ def execute_operation(operation: Operation) -> OperationResult:
                 error_type="validation",
             )
 
-        # Execute operation (semantic validation happens inside handler)
+        # Execute operation (semantic validation happens inside handler).
+        # Revision is bumped first so results cached for it describe the new state.
+        revision = bump_document_revision()
         affected_name = handler(operation, doc)
 
-        # Post-execution validation (geometry check)
-        if not validate_document(doc):
+        # Post-execution validation (geometry check), reused by commit if unchanged
+        if not validate_document(doc, revision):
             return OperationResult(
                 success=False,
                 message="Operation produced invalid geometry. Document validation failed.",
@@ -1,6 +1,7 @@
 """Handlers for sketch operations"""
 
 import math
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from adam_mcp.models.operations.sketches import (
@@ -18,6 +19,31 @@ else:
         FreeCAD = None  # type: ignore[assignment]
 
 
+# Sketch plane normals (sketches are placed at the origin)
+# XY plane: looking down (Z-axis up)
+# XZ plane: front view (Y-axis up)
+# YZ plane: side view (X-axis up)
+_PLANE_NORMALS: dict[str, tuple[float, float, float]] = {
+    "XY": (0, 0, 1),  # Z-axis normal
+    "XZ": (0, 1, 0),  # Y-axis normal
+    "YZ": (1, 0, 0),  # X-axis normal
+}
+
+
+@lru_cache(maxsize=len(_PLANE_NORMALS))
+def _plane_placement(plane: str) -> Any:
+    """
+    Get the sketch placement for a standard plane (built once per plane)
+
+    FreeCAD copies a Placement when it is assigned to a property, so the
+    cached instance is never mutated through a sketch.
+    """
+    return FreeCAD.Placement(
+        FreeCAD.Vector(0, 0, 0),
+        FreeCAD.Rotation(FreeCAD.Vector(0, 0, 1), FreeCAD.Vector(*_PLANE_NORMALS[plane])),
+    )
+
+
 def _get_and_validate_sketch(sketch_name: str, doc: Any) -> Any:
     """
     Get sketch object and validate it exists and is a valid sketch.
@@ -78,21 +104,8 @@ def execute_create_sketch(operation: CreateSketch, doc: Any) -> str:
     # Create sketch object
     sketch = doc.addObject("Sketcher::SketchObject", operation.name)
 
-    # Map plane names to FreeCAD placement
-    # XY plane: looking down (Z-axis up)
-    # XZ plane: front view (Y-axis up)
-    # YZ plane: side view (X-axis up)
-    plane_mappings = {
-        "XY": (FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1)),  # Origin, Z-axis normal
-        "XZ": (FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 1, 0)),  # Origin, Y-axis normal
-        "YZ": (FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(1, 0, 0)),  # Origin, X-axis normal
-    }
-
-    position, normal = plane_mappings[operation.plane]
     sketch.MapMode = "Deactivated"  # Deactivated mode doesn't need Support
-    sketch.Placement = FreeCAD.Placement(
-        position, FreeCAD.Rotation(FreeCAD.Vector(0, 0, 1), normal)
-    )
+    sketch.Placement = _plane_placement(operation.plane)
 
     # Recompute document
     doc.recompute()
@@ -2,9 +2,17 @@
 
 from typing import TYPE_CHECKING
 
+from adam_mcp.constants.dimensions import SUPPORTED_THREAD_TYPES
+
 if TYPE_CHECKING:
     import FreeCAD
 
+# Built once - the supported list never changes
+_THREAD_TYPE_ERROR = (
+    "Thread type '{thread_type}' not supported. "
+    f"Supported types: {', '.join(sorted(SUPPORTED_THREAD_TYPES))}"
+)
+
 
 def validate_sketch_for_pad(doc: "FreeCAD.Document", sketch_name: str) -> tuple[bool, str]:
     """
@@ -97,28 +105,8 @@ def validate_thread_type(thread_type: str) -> tuple[bool, str]:
         - (True, "") if thread type is valid
         - (False, error_message) if validation fails
     """
-    # Standard ISO metric thread sizes
-    valid_threads = {
-        "M3",
-        "M4",
-        "M5",
-        "M6",
-        "M8",
-        "M10",
-        "M12",
-        "M14",
-        "M16",
-        "M20",
-        "M24",
-        "M30",
-    }
-
-    if thread_type not in valid_threads:
-        return (
-            False,
-            f"Thread type '{thread_type}' not supported. "
-            f"Supported types: {', '.join(sorted(valid_threads))}",
-        )
+    if thread_type not in SUPPORTED_THREAD_TYPES:
+        return (False, _THREAD_TYPE_ERROR.format(thread_type=thread_type))
 
     return (True, "")
 
@@ -4,38 +4,52 @@ Document management tools for adam-mcp
 Tools for creating, opening, and managing FreeCAD documents.
 """
 
+import os
 import platform
-import shutil
+import stat
 import subprocess  # nosec B404 - Required for opening FreeCAD GUI on macOS/Linux
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Annotated, Any
 
 from pydantic import Field
 
 from adam_mcp.constants.messages import (
     ERROR_FILE_NOT_FOUND,
     ERROR_NO_OPEN_DOC,
+    ERROR_NOT_FREECAD_FILE,
     ERROR_VALIDATION_FAILED,
     SUCCESS_CHANGES_COMMITTED,
     SUCCESS_CHANGES_ROLLED_BACK,
 )
 from adam_mcp.constants.operations import (
+    MAX_OPEN_DOCUMENTS,
     VALIDATE_BEFORE_COMMIT,
 )
 from adam_mcp.core.working_files import (
-    get_active_main_file_path,
-    get_active_work_file_path,
+    commit_working_file,
+    flush_working_file,
+    get_session,
+    get_session_document,
     get_work_file_path,
+    mark_working_file_saved,
+    require_active_files,
     reset_operation_counter,
+    reset_working_file,
+    set_active_document_name,
     set_active_files,
     setup_working_file,
 )
 from adam_mcp.models.responses import DocumentInfo, HealthCheckResponse, ProjectInfo, ProjectsList
 from adam_mcp.utils.errors import format_freecad_error
-from adam_mcp.utils.freecad import get_active_document, get_freecad_version
+from adam_mcp.utils.freecad import (
+    backup_files_disabled,
+    get_freecad_version,
+)
 from adam_mcp.utils.paths import ensure_projects_directory, resolve_project_path
-from adam_mcp.utils.validation import validate_document
+from adam_mcp.utils.validation import validate_and_save
 
 if TYPE_CHECKING:
     import FreeCAD
@@ -47,6 +61,128 @@ else:
         FreeCAD = None  # type: ignore[assignment]
 
 
+# ============================================================================
+# Open Document Cache
+# ============================================================================
+
+
+@dataclass(slots=True)
+class _OpenDocument:
+    """Loaded document in the cache (and its working file state while inactive)"""
+
+    doc_name: str
+    work_path: str
+    unsaved_ops: int = 0  # Operations not yet saved to the working file
+    work_matches_main: bool = False  # Working file unchanged since its last commit or reset
+
+
+# main file path → loaded document, least recently used first.
+# Switching back to a cached document is a setActiveDocument call instead of a reload.
+_open_documents: OrderedDict[str, _OpenDocument] = OrderedDict()
+
+
+def _remember_document(main_file_path: str, doc_name: str, work_file_path: str) -> None:
+    """Record a loaded document as the most recently used"""
+    _open_documents[main_file_path] = _OpenDocument(doc_name, work_file_path)
+    _open_documents.move_to_end(main_file_path)
+
+
+def _stash_session_state() -> None:
+    """
+    Store the session's working file state on its cached document
+
+    Call before switching away, so the state is restored (not assumed clean) when
+    the document becomes the session document again.
+    """
+    session = get_session()
+    entry = _open_documents.get(session.main_path) if session.main_path else None
+    if entry is not None:
+        entry.unsaved_ops = session.unsaved_ops
+        entry.work_matches_main = session.work_matches_main
+
+
+def _cached_document(main_file_path: str) -> tuple[Any, _OpenDocument] | None:
+    """
+    Get a still-loaded document for a main file
+
+    Returns:
+        Tuple of (FreeCAD document, cache entry), or None if not loaded
+    """
+    entry = _open_documents.get(main_file_path)
+    if entry is None or FreeCAD is None:
+        return None
+
+    doc = FreeCAD.listDocuments().get(entry.doc_name)
+    if doc is None:
+        # Closed outside the cache (e.g. FreeCAD reload) - drop the stale entry
+        del _open_documents[main_file_path]
+        return None
+    return doc, entry
+
+
+def _forget_document(main_file_path: str) -> None:
+    """Close a cached document (if still loaded) and drop it from the cache"""
+    entry = _open_documents.pop(main_file_path, None)
+    if entry is not None and FreeCAD and entry.doc_name in FreeCAD.listDocuments():
+        FreeCAD.closeDocument(entry.doc_name)
+
+
+def _evict_documents() -> None:
+    """Close least recently used documents beyond the cache size"""
+    while len(_open_documents) > MAX_OPEN_DOCUMENTS:
+        _forget_document(next(iter(_open_documents)))
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+_FCSTD_MAGIC = b"PK\x03\x04"  # .FCStd files are ZIP archives
+
+
+def _has_fcstd_header(file_path: str) -> bool:
+    """Check the ZIP magic bytes so non-FreeCAD files are rejected before parsing"""
+    with Path(file_path).open("rb") as f:
+        return f.read(len(_FCSTD_MAGIC)) == _FCSTD_MAGIC
+
+
+def _scan_project_files(directory: str) -> list[tuple[str, os.stat_result]]:
+    """
+    Recursively find .FCStd files with their stat results
+
+    Uses os.scandir so directory entries come with their file type, and each
+    project file is stat'ed exactly once. Symlinked directories are not followed.
+    Unreadable directories and entries are skipped (like Path.glob).
+    """
+    found: list[tuple[str, os.stat_result]] = []
+    pending = [directory]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".FCStd") and entry.is_file():
+                        found.append((entry.path, entry.stat()))
+                except OSError:
+                    continue
+    return found
+
+
+def _build_document_info(doc: Any) -> DocumentInfo:
+    """
+    Build DocumentInfo for a FreeCAD document
+
+    Reads doc.Objects once - each access builds a new list on the C++ side.
+    """
+    names = [obj.Name for obj in doc.Objects]
+    return DocumentInfo(name=doc.Name, object_count=len(names), objects=names)
+
+
 # ============================================================================
 # Document Management Tools
 # ============================================================================
@@ -61,7 +197,7 @@ def health_check() -> HealthCheckResponse:
     """
     try:
         version = get_freecad_version()
-        active_doc = FreeCAD.ActiveDocument if FreeCAD else None
+        active_doc = getattr(FreeCAD, "ActiveDocument", None)
         doc_name = active_doc.Name if active_doc else None
 
         return HealthCheckResponse(
@@ -79,13 +215,16 @@ def health_check() -> HealthCheckResponse:
         )
 
 
-def open_document(path: str = Field(description="Path to .FCStd file to open")) -> DocumentInfo:
+def open_document(
+    path: Annotated[str | os.PathLike[str], Field(description="Path to .FCStd file to open")],
+) -> DocumentInfo:
     """
     Open existing FreeCAD document for editing.
 
     RESUME BY DEFAULT: If you've previously edited this file, your uncommitted changes
     in the .work file are preserved and you continue where you left off. The .work file
-    is only created from the main file if it doesn't exist yet.
+    is only created from the main file if it doesn't exist yet. Recently opened documents
+    stay loaded, so switching back to one skips reloading it from disk.
 
     All edits happen on the working file (.work), which is auto-saved every 5 operations.
     The main file is ONLY modified when you call commit_changes(). Use rollback_working_changes()
@@ -98,37 +237,80 @@ def open_document(path: str = Field(description="Path to .FCStd file to open"))
             - Subdirectory: "designs/bracket.FCStd"
             - Nested path: "fasteners/m10/bolt.FCStd"
             Note: Absolute paths (~/path or /path) are not allowed for security.
+            Path objects are accepted as well as strings.
 
     Returns:
         Information about the opened document
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        RuntimeError: If file can't be opened
+        RuntimeError: If file can't be opened or is not a FreeCAD document, or the
+            current document's pending operations can't be saved
     """
     # Resolve path (relative paths go to default projects directory)
-    main_file_path = resolve_project_path(path)
+    main_file_path = resolve_project_path(os.fspath(path))
+
+    # Already loaded: switch to it without touching the filesystem
+    cached = _cached_document(main_file_path)
+    if cached is not None:
+        doc, entry = cached
+        work_file_path = entry.work_path
+
+        # Save pending operations on the current document (raises, keeping the
+        # current document active, if they can't be saved)
+        flush_working_file()
+        try:
+            FreeCAD.setActiveDocument(doc.Name)
+        except (RuntimeError, OSError) as e:
+            raise RuntimeError(format_freecad_error(e, "Failed to switch document.")) from e
+        _stash_session_state()
+        set_active_files(main_file_path, work_file_path, doc.Name)
+        reset_operation_counter()
 
-    # Validate main file exists
-    if not Path(main_file_path).exists():
+        # Resume this document's own working file state (commit relies on it)
+        session = get_session()
+        session.unsaved_ops = entry.unsaved_ops
+        session.work_matches_main = entry.work_matches_main
+        _remember_document(main_file_path, doc.Name, work_file_path)
+        return _build_document_info(doc)
+
+    # Validate main file exists (single stat, reused by working file setup)
+    try:
+        main_stat = Path(main_file_path).stat()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(ERROR_FILE_NOT_FOUND.format(path=main_file_path)) from e
+    if not stat.S_ISREG(main_stat.st_mode):
         raise FileNotFoundError(ERROR_FILE_NOT_FOUND.format(path=main_file_path))
 
+    # Fail fast on files FreeCAD would only reject after a full parse attempt
     try:
-        # Setup working file (copies main → work)
-        work_file_path = setup_working_file(main_file_path)
-        set_active_files(main_file_path, work_file_path)
-        reset_operation_counter()
+        is_fcstd = _has_fcstd_header(main_file_path)
+    except OSError as e:
+        raise RuntimeError(format_freecad_error(e, f"Cannot read file: {main_file_path}")) from e
+    if not is_fcstd:
+        raise RuntimeError(ERROR_NOT_FREECAD_FILE.format(path=main_file_path))
+
+    # Save pending operations on the current document before switching
+    flush_working_file()
 
-        # Close any existing documents
-        if FreeCAD and FreeCAD.ActiveDocument:
-            FreeCAD.closeDocument(FreeCAD.ActiveDocument.Name)
+    try:
+        # Setup working file (copies main → work if needed)
+        work_file_path = setup_working_file(main_file_path, main_stat)
 
-        # Open working file in FreeCAD
+        # Open working file in FreeCAD (other cached documents stay loaded)
         doc = FreeCAD.open(work_file_path)
 
-        return DocumentInfo(
-            name=doc.Name, object_count=len(doc.Objects), objects=[obj.Name for obj in doc.Objects]
-        )
+        # Switch the session only once the document is loaded - if the open fails,
+        # the session keeps pointing at the previous document and its working file
+        _stash_session_state()
+        set_active_files(main_file_path, work_file_path, doc.Name)
+        reset_operation_counter()
+
+        # Close least recently used documents if the cache is over capacity
+        _remember_document(main_file_path, doc.Name, work_file_path)
+        _evict_documents()
+
+        return _build_document_info(doc)
 
     except (RuntimeError, OSError) as e:
         raise RuntimeError(
@@ -163,7 +345,8 @@ def create_document(
         Information about the created document
 
     Raises:
-        RuntimeError: If document can't be created or saved
+        RuntimeError: If document can't be created or saved, or the current
+            document's pending operations can't be saved
     """
     # Resolve path (relative paths go to default projects directory)
     main_file_path = resolve_project_path(path)
@@ -171,38 +354,36 @@ def create_document(
     # Ensure parent directory exists
     Path(main_file_path).parent.mkdir(parents=True, exist_ok=True)
 
+    # Save pending operations on the current document before switching
+    flush_working_file()
+
     try:
-        # Close any existing documents
-        if FreeCAD and FreeCAD.ActiveDocument:
-            FreeCAD.closeDocument(FreeCAD.ActiveDocument.Name)
+        # Close any loaded copy of the document being replaced
+        _forget_document(main_file_path)
 
         # Create new document
         doc = FreeCAD.newDocument()
 
         # Disable backup file creation during document creation to prevent .FCBak files
-        param_group = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Document")
-        original_backup_setting = param_group.GetBool("CreateBackupFiles", True)
-
-        try:
-            # Disable backups during initial save
-            param_group.SetBool("CreateBackupFiles", False)
-
+        with backup_files_disabled():
             # Save as main file (initial blank state)
             doc.saveAs(main_file_path)
 
-            # Setup working file (copies main → work)
-            work_file_path = setup_working_file(main_file_path)
-            set_active_files(main_file_path, work_file_path)
+            # Save working file straight from memory (copying main first would only
+            # be overwritten by this save)
+            work_file_path = get_work_file_path(main_file_path)
             doc.saveAs(work_file_path)
-            reset_operation_counter()
 
-        finally:
-            # Restore original backup setting
-            param_group.SetBool("CreateBackupFiles", original_backup_setting)
+        # Switch the session only once both files are written
+        _stash_session_state()
+        set_active_files(main_file_path, work_file_path, doc.Name)
+        reset_operation_counter()
 
-        return DocumentInfo(
-            name=doc.Name, object_count=len(doc.Objects), objects=[obj.Name for obj in doc.Objects]
-        )
+        # Close least recently used documents if the cache is over capacity
+        _remember_document(main_file_path, doc.Name, work_file_path)
+        _evict_documents()
+
+        return _build_document_info(doc)
 
     except (RuntimeError, OSError) as e:
         raise RuntimeError(
@@ -224,44 +405,37 @@ def commit_changes() -> str:
     Raises:
         RuntimeError: If no document open or validation fails
     """
-    main_file_path = get_active_main_file_path()
-    work_file_path = get_active_work_file_path()
-
-    if not main_file_path or not work_file_path:
-        raise RuntimeError(ERROR_NO_OPEN_DOC)
+    main_file_path, work_file_path = require_active_files()
+    doc = get_session_document()
+    session = get_session()
 
-    doc = get_active_document()
-
-    # Validate before committing (critical safety check)
-    if VALIDATE_BEFORE_COMMIT and not validate_document(doc):
-        raise RuntimeError(ERROR_VALIDATION_FAILED)
+    # Skip the save if auto-save already wrote every operation to the work file.
+    # unsaved_ops is per document: stashed on switch-away, restored on switch-back
+    needs_save = session.unsaved_ops > 0
 
     try:
-        # Disable backup file creation during commit to prevent .FCBak files
-        param_group = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Document")
-        original_backup_setting = param_group.GetBool("CreateBackupFiles", True)
-
-        try:
-            # Disable backups during save
-            param_group.SetBool("CreateBackupFiles", False)
-
-            # Save work file one more time
-            doc.save()
-
-        finally:
-            # Restore original backup setting
-            param_group.SetBool("CreateBackupFiles", original_backup_setting)
+        # Validate (critical safety check) and save work file one more time.
+        # Validation is skipped if this revision already passed it (e.g. post-operation check)
+        is_valid = validate_and_save(
+            doc, validate=VALIDATE_BEFORE_COMMIT, save=needs_save, revision=session.revision
+        )
 
         # Copy work → main (atomic commit)
-        shutil.copy2(work_file_path, main_file_path)
-
-        return SUCCESS_CHANGES_COMMITTED.format(path=main_file_path)
+        if is_valid:
+            if needs_save:
+                mark_working_file_saved()
+            commit_working_file(work_file_path, main_file_path)
 
     except (OSError, RuntimeError) as e:
         raise RuntimeError(
             format_freecad_error(e, "Check that main file is not open in another application.")
         ) from e
 
+    if not is_valid:
+        raise RuntimeError(ERROR_VALIDATION_FAILED)
+
+    return SUCCESS_CHANGES_COMMITTED.format(path=main_file_path)
+
 
 def rollback_working_changes() -> str:
     """
@@ -277,23 +451,23 @@ def rollback_working_changes() -> str:
     Raises:
         RuntimeError: If no document open
     """
-    main_file_path = get_active_main_file_path()
-    work_file_path = get_active_work_file_path()
-
-    if not main_file_path or not work_file_path:
-        raise RuntimeError(ERROR_NO_OPEN_DOC)
+    main_file_path, work_file_path = require_active_files()
 
     try:
-        # Close current working document
-        doc = get_active_document()
-        doc_name = doc.Name
-        FreeCAD.closeDocument(doc_name)
+        doc = get_session_document()
 
         # Copy main → work (reset)
-        shutil.copy2(main_file_path, work_file_path)
+        reset_working_file(main_file_path, work_file_path)
 
-        # Reopen work file
-        FreeCAD.open(work_file_path)
+        # Reload the document in place from the reset work file. This skips the
+        # close/reopen teardown; fall back to it if in-place restore fails.
+        try:
+            doc.restore()
+        except (AttributeError, RuntimeError):
+            FreeCAD.closeDocument(doc.Name)
+            doc = FreeCAD.open(work_file_path)
+            set_active_document_name(doc.Name)
+            _remember_document(main_file_path, doc.Name, work_file_path)
         reset_operation_counter()
 
         return SUCCESS_CHANGES_ROLLED_BACK.format(path=main_file_path)
@@ -312,10 +486,8 @@ def get_document_info() -> DocumentInfo:
         RuntimeError: If no active document exists
     """
     try:
-        doc = get_active_document()
-        return DocumentInfo(
-            name=doc.Name, object_count=len(doc.Objects), objects=[obj.Name for obj in doc.Objects]
-        )
+        doc = get_session_document()
+        return _build_document_info(doc)
     except AttributeError as e:
         raise RuntimeError(format_freecad_error(e)) from e
 
@@ -325,7 +497,8 @@ def open_in_freecad_gui() -> str:
     Open the working file in FreeCAD GUI for viewing.
 
     Opens the active .work file in the FreeCAD desktop application. The file is auto-saved
-    after each operation. To see updates, manually reload in FreeCAD (File → Reload).
+    after each operation (less often for large documents, pending operations are saved
+    before launching). To see updates, manually reload in FreeCAD (File → Reload).
 
     Returns:
         Success message with path to working file
@@ -333,11 +506,14 @@ def open_in_freecad_gui() -> str:
     Raises:
         RuntimeError: If no document is open or FreeCAD app can't be found
     """
-    work_file_path = get_active_work_file_path()
+    work_file_path = get_session().work_path
 
     if not work_file_path:
         raise RuntimeError(ERROR_NO_OPEN_DOC)
 
+    # GUI reads the file from disk, so save any operations not yet auto-saved
+    flush_working_file()
+
     if not Path(work_file_path).exists():
         raise RuntimeError(ERROR_FILE_NOT_FOUND.format(path=work_file_path))
 
@@ -345,15 +521,28 @@ def open_in_freecad_gui() -> str:
         system = platform.system()
 
         if system == "Darwin":  # macOS
-            subprocess.Popen(["open", "-a", "FreeCAD", work_file_path])  # nosec B603 B607
+            command = ["open", "-a", "FreeCAD", work_file_path]
         elif system == "Linux":
-            subprocess.Popen(["freecad", work_file_path])  # nosec B603 B607
+            command = ["freecad", work_file_path]
         elif system == "Windows":
             freecad_exe = "FreeCAD.exe"
-            subprocess.Popen([freecad_exe, work_file_path])  # nosec B603 B607
+            command = [freecad_exe, work_file_path]
         else:
             raise RuntimeError(f"Unsupported platform: {system}")
 
+        # Detach the GUI from the server: no inherited file descriptors or stdio
+        # (stdout carries the MCP protocol), and its own session so it outlives us.
+        # Without a preexec_fn, CPython forks via vfork() on Linux, so the server's
+        # (possibly large) address space is not copied.
+        subprocess.Popen(  # nosec B603 B607
+            command,
+            close_fds=True,
+            start_new_session=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
         return f"Opened working file in FreeCAD GUI: {work_file_path}\nUse File → Reload to see updates after operations."
 
     except FileNotFoundError as e:
@@ -391,28 +580,26 @@ def list_projects(directory: str | None = None) -> ProjectsList:
             raise RuntimeError(f"Not a directory: {directory}")
 
     try:
-        # Find all .FCStd files
+        # Find all .FCStd files (newest first)
         project_files = sorted(
-            search_dir.glob("**/*.FCStd"), key=lambda p: p.stat().st_mtime, reverse=True
+            _scan_project_files(str(search_dir)), key=lambda item: item[1].st_mtime, reverse=True
         )
 
         # Build project info list
         projects: list[ProjectInfo] = []
-        for project_file in project_files:
-            stat = project_file.stat()
-
+        for project_file, file_stat in project_files:
             # Check if working file exists
-            work_file_path = get_work_file_path(str(project_file))
+            work_file_path = get_work_file_path(project_file)
             has_working_file = Path(work_file_path).exists()
 
             # Format modified time as ISO
-            modified_time = datetime.fromtimestamp(stat.st_mtime).isoformat()
+            modified_time = datetime.fromtimestamp(file_stat.st_mtime).isoformat()
 
             projects.append(
                 ProjectInfo(
-                    name=project_file.name,
-                    path=str(project_file),
-                    size_bytes=stat.st_size,
+                    name=Path(project_file).name,
+                    path=project_file,
+                    size_bytes=file_stat.st_size,
                     modified_time=modified_time,
                     has_working_file=has_working_file,
                 )
@@ -4,8 +4,10 @@ Query tools for inspecting CAD documents
 Tools for listing objects and getting detailed object information.
 """
 
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
+from adam_mcp.core.working_files import get_session_document
 from adam_mcp.models.responses import (
     ObjectDetail,
     ObjectDetailsResponse,
@@ -14,7 +16,6 @@ from adam_mcp.models.responses import (
     ObjectSummary,
 )
 from adam_mcp.utils.errors import format_freecad_error
-from adam_mcp.utils.freecad import get_active_document
 
 if TYPE_CHECKING:
     import FreeCAD
@@ -43,25 +44,27 @@ def list_objects() -> ObjectListResponse:
         List of object summaries with dependency information
 
     Raises:
-        RuntimeError: If no active document exists
+        RuntimeError: If no document is open
     """
     try:
-        doc = get_active_document()
-
-        # Build object summaries
-        summaries: list[ObjectSummary] = []
-        for obj in doc.Objects:
-            # Get objects this object depends on
-            depends_on = [dep.Name for dep in obj.InList if dep in doc.Objects]
-
-            summaries.append(
-                ObjectSummary(
-                    name=obj.Name,
-                    type=obj.TypeId,
-                    label=obj.Label,
-                    depends_on=depends_on,
-                )
+        doc = get_session_document()
+        objects = doc.Objects
+
+        # Identity set for membership checks (doc.Objects rebuilds its list per access)
+        object_ids = {id(obj) for obj in objects}
+        get_fields = attrgetter("Name", "TypeId", "Label", "InList")
+
+        # Build object summaries in one sized pass (fields come straight from FreeCAD,
+        # skip validation). depends_on lists the objects this object depends on.
+        summaries = [
+            ObjectSummary.model_construct(
+                name=name,
+                type=type_id,
+                label=label,
+                depends_on=[dep.Name for dep in in_list if id(dep) in object_ids],
             )
+            for name, type_id, label, in_list in map(get_fields, objects)
+        ]
 
         return ObjectListResponse(count=len(summaries), objects=summaries)
 
@@ -69,7 +72,9 @@ def list_objects() -> ObjectListResponse:
         raise RuntimeError(format_freecad_error(e, "Failed to list objects")) from e
 
 
-def get_object_details(names: list[str]) -> ObjectDetailsResponse:
+def get_object_details(
+    names: list[str], max_properties: int | None = None
+) -> ObjectDetailsResponse:
     """
     Get detailed information for specific objects.
 
@@ -79,18 +84,29 @@ def get_object_details(names: list[str]) -> ObjectDetailsResponse:
 
     Args:
         names: List of object names to fetch details for
+        max_properties: Optional cap on properties returned per object. Values are
+            only read for the returned properties; property_count still reports
+            the total.
 
     Returns:
         Detailed information for found objects, plus list of not found names
 
     Raises:
-        RuntimeError: If no active document exists
+        ValueError: If max_properties is negative
+        RuntimeError: If no document is open
     """
+    if max_properties is not None and max_properties < 0:
+        raise ValueError(f"max_properties must be 0 or greater (got {max_properties})")
+
     try:
-        doc = get_active_document()
+        doc = get_session_document()
 
-        # Build lookup for all objects
-        obj_by_name = {obj.Name: obj for obj in doc.Objects}
+        # Build lookup for all objects (read doc.Objects once - it rebuilds its list
+        # per access); the identity set answers dependency membership in O(1)
+        objects = doc.Objects
+        obj_by_name = {obj.Name: obj for obj in objects}
+        object_ids = {id(obj) for obj in objects}
+        document_object_type = FreeCAD.DocumentObject
 
         details: list[ObjectDetail] = []
         not_found: list[str] = []
@@ -103,33 +119,45 @@ def get_object_details(names: list[str]) -> ObjectDetailsResponse:
             obj = obj_by_name[name]
 
             # Extract all properties
+            # Values are serialized here, so skip per-property Pydantic validation
             properties: list[ObjectProperty] = []
-            for prop_name in obj.PropertiesList:
+            prop_names = obj.PropertiesList
+            for prop_name in prop_names:
+                # Past the limit, remaining values are never read or stringified
+                if max_properties is not None and len(properties) >= max_properties:
+                    break
+
                 try:
                     prop_value = getattr(obj, prop_name)
-                    prop_type = type(prop_value).__name__
 
                     # Serialize value as string
                     # Special handling for FreeCAD objects (show name, not repr)
-                    value_str = prop_value.Name if hasattr(prop_value, "Name") else str(prop_value)
+                    value_str = (
+                        prop_value.Name
+                        if isinstance(prop_value, document_object_type)
+                        else str(prop_value)
+                    )
 
                     properties.append(
-                        ObjectProperty(name=prop_name, value=value_str, type=prop_type)
+                        ObjectProperty.model_construct(
+                            name=prop_name, value=value_str, type=prop_value.__class__.__name__
+                        )
                     )
                 except (AttributeError, RuntimeError):
                     # Skip properties that can't be read
                     continue
 
             # Get dependency information
-            depends_on = [dep.Name for dep in obj.InList if dep in doc.Objects]
-            depended_by = [dep.Name for dep in obj.OutList if dep in doc.Objects]
+            depends_on = [dep.Name for dep in obj.InList if id(dep) in object_ids]
+            depended_by = [dep.Name for dep in obj.OutList if id(dep) in object_ids]
 
             details.append(
-                ObjectDetail(
+                ObjectDetail.model_construct(
                     name=obj.Name,
                     type=obj.TypeId,
                     label=obj.Label,
                     properties=properties,
+                    property_count=len(prop_names),
                     depends_on=depends_on,
                     depended_by=depended_by,
                 )
@@ -1,16 +1,22 @@
 """Utilities for adam-mcp"""
 
 from adam_mcp.utils.errors import format_freecad_error
-from adam_mcp.utils.freecad import get_active_document, get_freecad_version
+from adam_mcp.utils.freecad import (
+    backup_files_disabled,
+    get_freecad_version,
+    get_loaded_document,
+)
 from adam_mcp.utils.paths import ensure_projects_directory, resolve_project_path
-from adam_mcp.utils.validation import validate_dimension, validate_document
+from adam_mcp.utils.validation import validate_and_save, validate_dimension, validate_document
 
 __all__ = [
     "format_freecad_error",
     "get_freecad_version",
-    "get_active_document",
+    "get_loaded_document",
+    "backup_files_disabled",
     "resolve_project_path",
     "ensure_projects_directory",
     "validate_dimension",
     "validate_document",
+    "validate_and_save",
 ]
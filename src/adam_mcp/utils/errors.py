@@ -1,6 +1,6 @@
 """Error formatting utilities"""
 
-from adam_mcp.constants.messages import ERROR_FREECAD_API
+from adam_mcp.constants.messages import ERROR_FREECAD_API, ERROR_FREECAD_API_SUGGESTION
 
 
 def format_freecad_error(error: Exception, suggestion: str = "") -> str:
@@ -14,6 +14,6 @@ def format_freecad_error(error: Exception, suggestion: str = "") -> str:
     Returns:
         Formatted error message
     """
-    if not suggestion:
-        suggestion = "Check FreeCAD documentation for valid parameters."
-    return ERROR_FREECAD_API.format(error=str(error), suggestion=suggestion)
+    return ERROR_FREECAD_API.format(
+        error=error, suggestion=suggestion or ERROR_FREECAD_API_SUGGESTION
+    )
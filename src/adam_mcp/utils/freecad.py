@@ -1,48 +1,83 @@
 """FreeCAD utilities"""
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any
 
-from adam_mcp.constants.messages import ERROR_NO_ACTIVE_DOC
+# FreeCAD module, imported on first use (after environment setup) rather than at import
+_freecad: Any = None
 
-if TYPE_CHECKING:
-    import FreeCAD
-else:
-    # Import FreeCAD at runtime after environment setup
-    try:
-        import FreeCAD
-    except ImportError:
-        FreeCAD = None  # type: ignore[assignment]
 
+def _get_freecad() -> Any:
+    """
+    Get the FreeCAD module, importing it on first use
+
+    Returns:
+        FreeCAD module
 
+    Raises:
+        RuntimeError: If FreeCAD can't be imported (failures are retried next call)
+    """
+    global _freecad
+    if _freecad is None:
+        try:
+            import FreeCAD
+        except ImportError as e:
+            raise RuntimeError("FreeCAD not initialized") from e
+        _freecad = FreeCAD
+    return _freecad
+
+
+@lru_cache(maxsize=1)
 def get_freecad_version() -> str:
     """
     Get FreeCAD version string
 
+    The version cannot change during the process lifetime, so the first
+    successful lookup is cached (failures are not cached and will retry).
+
     Returns:
         Version string (e.g., "1.0.2")
 
     Raises:
         RuntimeError: If FreeCAD is not initialized
     """
-    if FreeCAD is None:
-        raise RuntimeError("FreeCAD not initialized")
-    version_parts = FreeCAD.Version()[:3]
+    version_parts = _get_freecad().Version()[:3]
     return ".".join(version_parts)
 
 
-def get_active_document() -> Any:
+def get_loaded_document(name: str) -> Any:
     """
-    Get active FreeCAD document
+    Get a loaded FreeCAD document by name
+
+    Args:
+        name: Document name (doc.Name, not the label)
 
     Returns:
-        Active document object
+        Document object, or None if no document with that name is loaded
 
     Raises:
-        RuntimeError: If no active document exists
-    """
-    if FreeCAD is None:
-        raise RuntimeError("FreeCAD not initialized")
-    doc = FreeCAD.ActiveDocument
-    if doc is None:
-        raise RuntimeError(ERROR_NO_ACTIVE_DOC)
-    return doc
+        RuntimeError: If FreeCAD is not initialized
+    """
+    return _get_freecad().listDocuments().get(name)
+
+
+@contextmanager
+def backup_files_disabled() -> Iterator[None]:
+    """
+    Temporarily disable FreeCAD backup file creation
+
+    Saves made inside this context do not leave timestamped .FCBak files
+    next to the saved document. The original preference is restored on exit.
+
+    Raises:
+        RuntimeError: If FreeCAD is not initialized
+    """
+    param_group = _get_freecad().ParamGet("User parameter:BaseApp/Preferences/Document")
+    original_backup_setting = param_group.GetBool("CreateBackupFiles", True)
+    param_group.SetBool("CreateBackupFiles", False)
+    try:
+        yield
+    finally:
+        param_group.SetBool("CreateBackupFiles", original_backup_setting)
@@ -1,9 +1,15 @@
 """Path resolution utilities"""
 
+import os
+from functools import cache
 from pathlib import Path
 
 from adam_mcp.constants.paths import DEFAULT_PROJECTS_DIR
 
+# Resolved once - DEFAULT_PROJECTS_DIR is fixed for the life of the process
+_DEFAULT_DIR = str(Path(DEFAULT_PROJECTS_DIR).expanduser().resolve())
+_DEFAULT_DIR_PREFIX = _DEFAULT_DIR.rstrip(os.sep) + os.sep  # With trailing separator
+
 
 def resolve_project_path(path: str) -> str:
     """
@@ -38,25 +44,30 @@ def resolve_project_path(path: str) -> str:
         )
 
     # Relative path or filename → resolve to default projects directory
-    default_dir = Path(DEFAULT_PROJECTS_DIR).expanduser().resolve()
-    resolved_path = (default_dir / path_obj).resolve()
+    # Symlinks are resolved (not just ".." collapsed), so a link inside the projects
+    # directory can't point the path outside it. Not memoized - links can change.
+    resolved_path = os.path.realpath(Path(_DEFAULT_DIR) / path_obj)
 
     # Security check: ensure resolved path is still within default directory
     # (prevents ../../../etc/passwd type attacks)
-    if not str(resolved_path).startswith(str(default_dir)):
+    # Compare against the directory plus separator, so a sibling such as
+    # "<projects>_evil" doesn't pass as being inside "<projects>"
+    if resolved_path != _DEFAULT_DIR and not resolved_path.startswith(_DEFAULT_DIR_PREFIX):
         raise ValueError(
             f"Path escapes project directory: '{path}'. "
             f"Paths must stay within: {DEFAULT_PROJECTS_DIR}"
         )
 
-    return str(resolved_path)
+    return resolved_path
 
 
+@cache
 def ensure_projects_directory() -> Path:
     """
     Ensure default projects directory exists.
 
-    Creates the directory if it doesn't exist.
+    Creates the directory if it doesn't exist. Reuses the directory resolved at
+    import, and only the first successful call touches the file system.
 
     Returns:
         Path to default projects directory
@@ -65,7 +76,7 @@ def ensure_projects_directory() -> Path:
         RuntimeError: If directory cannot be created
     """
     try:
-        projects_dir = Path(DEFAULT_PROJECTS_DIR).expanduser().resolve()
+        projects_dir = Path(_DEFAULT_DIR)
         projects_dir.mkdir(parents=True, exist_ok=True)
         return projects_dir
     except OSError as e:
@@ -1,9 +1,13 @@
 """Validation utilities"""
 
+import logging
 from typing import Any
 
 from adam_mcp.constants.dimensions import MAX_DIMENSION_MM, MIN_DIMENSION_MM
 from adam_mcp.constants.messages import ERROR_INVALID_DIMENSION
+from adam_mcp.utils.freecad import backup_files_disabled
+
+logger = logging.getLogger(__name__)
 
 
 def validate_dimension(value: float, param_name: str) -> None:
@@ -26,10 +30,42 @@ def validate_dimension(value: float, param_name: str) -> None:
         )
 
 
-def validate_document(doc: Any) -> bool:
+# (document name, revision, result) of the last revision-keyed validation.
+# Lets commit reuse the post-operation check when nothing changed in between.
+_last_validation: tuple[str, int, bool] | None = None
+
+
+def validate_document(doc: Any, revision: int | None = None) -> bool:
     """
     Validate document is in good state before committing
 
+    Args:
+        doc: FreeCAD document to validate
+        revision: Document revision (see core.working_files). When given, a repeat
+            call for the same document and revision returns the cached result
+            without recomputing.
+
+    Returns:
+        True if document is valid, False otherwise
+    """
+    global _last_validation
+
+    if revision is not None:
+        cached = _last_validation
+        if cached is not None and cached[1] == revision and cached[0] == doc.Name:
+            return cached[2]
+
+    is_valid = _check_document(doc)
+
+    if revision is not None:
+        _last_validation = (doc.Name, revision, is_valid)
+    return is_valid
+
+
+def _check_document(doc: Any) -> bool:
+    """
+    Recompute and check a document (uncached part of validate_document)
+
     Checks for common error conditions that indicate corrupted geometry:
     - Document recomputes successfully
     - Document has objects (not empty)
@@ -43,32 +79,70 @@ def validate_document(doc: Any) -> bool:
         True if document is valid, False otherwise
     """
     try:
-        # Recompute should succeed
-        doc.recompute()
+        objects = doc.Objects
 
-        # Should have objects
-        if len(doc.Objects) == 0:
-            print("Validation: Document is empty")
+        # Should have objects (checked first - nothing to recompute in an empty document)
+        if not objects:
+            logger.warning("Validation: Document is empty")
             return False
 
-        # Check each object
-        for obj in doc.Objects:
-            # Check object state
-            if hasattr(obj, "State") and "Invalid" in str(obj.State):
-                print(f"Validation: Object {obj.Name} has invalid state: {obj.State}")
+        # Recompute should succeed (only needed if some object is out of date -
+        # a recompute walks the whole dependency graph even when nothing changed)
+        if any("Touched" in getattr(obj, "State", ()) for obj in objects):
+            doc.recompute()
+
+        # Check each object (getattr with default, not hasattr + a second lookup)
+        for obj in objects:
+            # Check object state (State is a list of status strings)
+            state = getattr(obj, "State", None)
+            if state is not None and "Invalid" in state:
+                logger.warning("Validation: Object %s has invalid state: %s", obj.Name, state)
                 return False
 
             # Skip shape validation for sketches (sketches are valid even with empty geometry)
-            if hasattr(obj, "TypeId") and obj.TypeId == "Sketcher::SketchObject":
+            if getattr(obj, "TypeId", None) == "Sketcher::SketchObject":
                 continue
 
             # Check shape validity for non-sketch objects
-            if hasattr(obj, "Shape") and obj.Shape and not obj.Shape.isValid():
-                print(f"Validation: Object {obj.Name} has invalid shape")
+            shape = getattr(obj, "Shape", None)
+            if shape and not shape.isValid():
+                logger.warning("Validation: Object %s has invalid shape", obj.Name)
                 return False
 
         return True
 
     except Exception as e:
-        print(f"Validation error: {e}")
+        logger.warning("Validation error: %s", e)
         return False
+
+
+def validate_and_save(
+    doc: Any, validate: bool = True, save: bool = True, revision: int | None = None
+) -> bool:
+    """
+    Validate document and save it to its current file in one step
+
+    The document is only saved if validation passes, so a corrupted state
+    never reaches disk. Backup file creation is suppressed during the save.
+
+    Args:
+        doc: FreeCAD document to validate and save
+        validate: Run validate_document() before saving (False saves unconditionally)
+        save: Save after validation (False when the file on disk is already current)
+        revision: Document revision, lets validation reuse a cached result
+
+    Returns:
+        True if document was valid (and saved if requested), False if validation failed
+
+    Raises:
+        RuntimeError: If saving fails
+        OSError: If saving fails
+    """
+    if validate and not validate_document(doc, revision):
+        return False
+
+    if save:
+        with backup_files_disabled():
+            doc.save()
+
+    return True